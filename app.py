@@ -4,8 +4,45 @@ import plotly.express as px
 import plotly.graph_objects as go
 import plotly.io as pio
 import numpy as np
-import requests
-from io import StringIO
+
+# Infrastructure categories mapped to their (exists, does not exist) indicator columns
+INFRASTRUCTURE_MAPPING = {
+    'Hotels': ('Existence of hotels - exists', 'Existence of hotels - does not exist'),
+    'Restaurants': ('Existence of restaurants - exists', 'Existence of restaurants - does not exist'),
+    'Cafes': ('Existence of cafes - exists', 'Existence of cafes - does not exist'),
+    'Guest Houses': ('Existence of guest houses - exists', 'Existence of guest houses - does not exist'),
+    'Tourist Attractions': ('Existence of touristic attractions prone to be exploited and developed - exists', 
+                           'Existence of touristic attractions that can be expolited and developed - does not exist')
+}
+EXISTS_COLS = tuple(pair[0] for pair in INFRASTRUCTURE_MAPPING.values())
+NOT_EXISTS_COLS = tuple(pair[1] for pair in INFRASTRUCTURE_MAPPING.values())
+ALL_FLAG_COLS = tuple(col for pair in INFRASTRUCTURE_MAPPING.values() for col in pair)
+
+# Per-town facility count columns
+FACILITY_COUNT_COLS = (
+    'Total number of hotels',
+    'Total number of restaurants',
+    'Total number of cafes',
+    'Total number of guest houses'
+)
+
+# Facility types selectable for bubble sizing, mapped to their processed count columns
+FACILITY_TYPE_COLUMNS = {
+    'Hotels': 'Total_Hotels',
+    'Restaurants': 'Total_Restaurants',
+    'Cafes': 'Total_Cafes',
+    'Guest Houses': 'Total_Guest_Houses'
+}
+
+# Only these columns of the source CSV are used by the dashboard
+USED_COLUMNS = frozenset(('Town',) + ALL_FLAG_COLS + FACILITY_COUNT_COLS)
+
+# Shared Plotly mode bar setup; image exports go through the download buttons instead
+PLOTLY_CHART_CONFIG = {
+    'displaylogo': False,
+    'modeBarButtonsToRemove': ['lasso2d', 'select2d', 'autoScale2d', 'toggleSpikelines'],
+    'responsive': True
+}
 
 # Page configuration
 st.set_page_config(
@@ -16,7 +53,7 @@ st.set_page_config(
 )
 
 # Custom CSS for enhanced dark styling
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     /* Main app background */
     .stApp {
@@ -149,19 +186,94 @@ st.markdown("""
         color: #d4af37;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Static page sections, rendered unchanged on every rerun
+HEADER_HTML = '<div class="main-header">🇱🇧 Lebanon Tourism Infrastructure Analysis</div>'
+
+OVERVIEW_HTML = """
+<div class="context-section">
+<h2>📖 Analysis Overview</h2>
+<p style="font-size: 1.1rem; line-height: 1.6;">
+This comprehensive analysis explores Lebanon's tourism infrastructure through two complementary visualizations 
+that reveal critical insights about the country's tourism readiness and development patterns.
+</p>
+
+<h3>🎯 Research Questions:</h3>
+<ul style="font-size: 1rem; line-height: 1.5;">
+<li><strong>Infrastructure Distribution:</strong> How evenly distributed are tourism facilities across Lebanese towns?</li>
+<li><strong>Facility Correlation:</strong> Do towns with more hotels also have more restaurants, indicating integrated tourism development?</li>
+<li><strong>Tourism Readiness:</strong> Which towns are best equipped to handle tourists with comprehensive infrastructure?</li>
+</ul>
 
-@st.cache_data
+<h3>📊 Data Source:</h3>
+<p style="font-size: 1rem;">
+American University of Beirut (AUB) Lebanon Tourism Infrastructure Dataset - A comprehensive survey of 
+tourism facilities and attractions across Lebanese municipalities.
+</p>
+</div>
+"""
+
+READINESS_SUMMARY_HTML = """
+<div class="insight-box">
+<h4>🏆 Tourism Readiness Summary</h4>
+<ul>
+<li><strong>Comprehensive Tourism Hubs:</strong> Towns with 10+ total facilities</li>
+<li><strong>Integrated Development:</strong> Towns with both hotels and restaurants</li>
+<li><strong>Infrastructure Gaps:</strong> Areas needing development focus</li>
+</ul>
+</div>
+"""
+
+RECOMMENDATIONS_HTML = """
+<div class="context-section">
+<h3>📋 Strategic Recommendations</h3>
+<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 2rem;">
+    <div>
+        <h4>🎯 For Tourism Development:</h4>
+        <ul>
+        <li>Focus on towns with attractions but limited infrastructure</li>
+        <li>Develop integrated hotel-restaurant complexes</li>
+        <li>Support infrastructure in high-potential areas</li>
+        </ul>
+    </div>
+    <div>
+        <h4>📊 For Further Analysis:</h4>
+        <ul>
+        <li>Geographic clustering analysis of facilities</li>
+        <li>Seasonal capacity vs. demand analysis</li>
+        <li>Infrastructure quality assessment</li>
+        </ul>
+    </div>
+</div>
+</div>
+"""
+
+FOOTER_MARKDOWN = """
+---
+**📊 Data Source:** American University of Beirut - Lebanon Tourism Infrastructure Study
+
+**✨ Enhanced Features:** Interactive filtering, dynamic visualizations, correlation analysis, and download capabilities
+"""
+
+st.html(CUSTOM_CSS)
+
+@st.cache_data(persist="disk", show_spinner=False)
 def load_data():
-    """Load and cache the Lebanon tourism data"""
+    """Load and cache the Lebanon tourism data (persisted to disk across restarts)"""
     url = "https://linked.aub.edu.lb/pkgcube/data/df6527f0de0990b7237dbcef186a3d52_20240904_215117.csv"
-    try:
-        response = requests.get(url)
-        data = pd.read_csv(StringIO(response.text))
-        return data
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        return None
+    # Let pandas stream the response into the C parser, keeping only the columns we use
+    data = pd.read_csv(url, usecols=lambda col: col in USED_COLUMNS)
+    
+    # Infrastructure indicators are 0/1 flags; store them as int8 instead of int64
+    flag_cols = [col for col in ALL_FLAG_COLS if col in data.columns]
+    data[flag_cols] = data[flag_cols].fillna(0).astype('int8')
+    return data
+
+@st.cache_data(show_spinner=False, hash_funcs={go.Figure: lambda fig: fig.to_json()})
+def render_figure_image(fig, image_format, width=None, height=None, scale=None):
+    """Render a Plotly figure to static image bytes, cached so Kaleido only runs when the figure changes"""
+    return pio.to_image(fig, format=image_format, width=width, height=height, scale=scale)
 
 def create_download_buttons(fig, chart_name):
     """Create download buttons for Plotly charts"""
@@ -169,7 +281,7 @@ def create_download_buttons(fig, chart_name):
     
     with col1:
         try:
-            img_bytes = pio.to_image(fig, format="png", width=1200, height=800, scale=2)
+            img_bytes = render_figure_image(fig, "png", width=1200, height=800, scale=2)
             st.download_button(
                 label="📥 Download PNG",
                 data=img_bytes,
@@ -192,7 +304,7 @@ def create_download_buttons(fig, chart_name):
     
     with col3:
         try:
-            svg_bytes = pio.to_image(fig, format="svg")
+            svg_bytes = render_figure_image(fig, "svg")
             st.download_button(
                 label="📥 Download SVG",
                 data=svg_bytes,
@@ -203,78 +315,70 @@ def create_download_buttons(fig, chart_name):
         except:
             st.info("SVG download requires kaleido package")
 
+@st.cache_data(persist="disk", show_spinner=False)
 def process_infrastructure_data(df):
     """Process data for infrastructure availability analysis"""
-    # Define infrastructure categories
-    infrastructure_mapping = {
-        'Hotels': ('Existence of hotels - exists', 'Existence of hotels - does not exist'),
-        'Restaurants': ('Existence of restaurants - exists', 'Existence of restaurants - does not exist'),
-        'Cafes': ('Existence of cafes - exists', 'Existence of cafes - does not exist'),
-        'Guest Houses': ('Existence of guest houses - exists', 'Existence of guest houses - does not exist'),
-        'Tourist Attractions': ('Existence of touristic attractions prone to be exploited and developed - exists', 
-                               'Existence of touristic attractions that can be expolited and developed - does not exist')
-    }
-    
-    infrastructure_data = []
-    for category, (exists_col, not_exists_col) in infrastructure_mapping.items():
-        exists_count = df[exists_col].sum() if exists_col in df.columns else 0
-        not_exists_count = df[not_exists_col].sum() if not_exists_col in df.columns else 0
-        total = exists_count + not_exists_count
-        percentage = (exists_count / total * 100) if total > 0 else 0
-        
-        infrastructure_data.append({
-            'Category': category,
-            'Towns_With': exists_count,
-            'Towns_Without': not_exists_count,
-            'Total_Towns': total,
-            'Availability_Percentage': percentage
-        })
-    
-    return pd.DataFrame(infrastructure_data)
+    # Sum all indicator columns in one pass; missing columns count as zero
+    sums = df.reindex(columns=list(EXISTS_COLS + NOT_EXISTS_COLS), fill_value=0).sum(axis=0).to_numpy()
+    
+    exists_counts = sums[:len(EXISTS_COLS)]
+    not_exists_counts = sums[len(EXISTS_COLS):]
+    totals = exists_counts + not_exists_counts
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percentages = np.where(totals > 0, exists_counts / totals * 100, 0)
+    
+    return pd.DataFrame({
+        'Category': list(INFRASTRUCTURE_MAPPING),
+        'Towns_With': exists_counts,
+        'Towns_Without': not_exists_counts,
+        'Total_Towns': totals,
+        'Availability_Percentage': percentages
+    })
 
+@st.cache_data(persist="disk", show_spinner=False)
 def process_facility_counts(df):
     """Process data for facility count analysis"""
-    # Calculate totals for each town
-    df_processed = df.copy()
-    df_processed['Total_Hotels'] = pd.to_numeric(df_processed['Total number of hotels'], errors='coerce').fillna(0)
-    df_processed['Total_Restaurants'] = pd.to_numeric(df_processed['Total number of restaurants'], errors='coerce').fillna(0)
-    df_processed['Total_Cafes'] = pd.to_numeric(df_processed['Total number of cafes'], errors='coerce').fillna(0)
-    df_processed['Total_Guest_Houses'] = pd.to_numeric(df_processed['Total number of guest houses'], errors='coerce').fillna(0)
+    # Convert all count columns in one block and name them after their facility type;
+    # counts are small whole numbers, so int16 is plenty
+    counts = df[list(FACILITY_COUNT_COLS)].apply(pd.to_numeric, errors='coerce').fillna(0).round().astype('int16')
+    counts = counts.rename(columns=dict(zip(FACILITY_COUNT_COLS, FACILITY_TYPE_COLUMNS.values())))
     
     # Calculate combined totals
-    df_processed['Total_Facilities'] = (df_processed['Total_Hotels'] + 
-                                       df_processed['Total_Restaurants'] + 
-                                       df_processed['Total_Cafes'] + 
-                                       df_processed['Total_Guest_Houses'])
+    counts['Total_Facilities'] = counts.sum(axis=1).astype('int16')
     
     # Filter towns with facilities
-    df_with_facilities = df_processed[df_processed['Total_Facilities'] > 0].copy()
+    df_processed = pd.concat([df, counts], axis=1)
+    df_with_facilities = df_processed[counts['Total_Facilities'].to_numpy() > 0]
     
     return df_with_facilities
 
-def create_infrastructure_availability_chart(df, selected_categories, chart_style):
+@st.cache_data(show_spinner=False)
+def create_infrastructure_availability_chart(filtered_df, chart_style):
     """Create Visualization 1: Infrastructure Availability with subtle animations"""
     
-    filtered_df = df[df['Category'].isin(selected_categories)]
-    
     if chart_style == "Horizontal Bar Chart":
+        # Hand plotly plain arrays rather than pandas Series
+        categories = filtered_df['Category'].to_numpy()
+        towns_with = filtered_df['Towns_With'].to_numpy()
+        towns_without = filtered_df['Towns_Without'].to_numpy()
+        
         fig = go.Figure()
         
         # Add bars with subtle hover animations
         fig.add_trace(go.Bar(
             name='Towns With Infrastructure',
-            y=filtered_df['Category'],
-            x=filtered_df['Towns_With'],
+            y=categories,
+            x=towns_with,
             orientation='h',
             marker=dict(
                 color='#2ecc71', 
                 opacity=0.8,
                 line=dict(color='#27ae60', width=2)
             ),
-            text=filtered_df['Towns_With'],
+            text=towns_with,
             textposition='inside',
             hovertemplate='<b>%{y}</b><br>Towns with infrastructure: %{x}<br>Percentage: %{customdata:.1f}%<extra></extra>',
-            customdata=filtered_df['Availability_Percentage'],
+            customdata=filtered_df['Availability_Percentage'].to_numpy(),
             # Subtle animation on load
             marker_line_width=2,
             textfont_size=12
@@ -282,15 +386,15 @@ def create_infrastructure_availability_chart(df, selected_categories, chart_styl
         
         fig.add_trace(go.Bar(
             name='Towns Without Infrastructure',
-            y=filtered_df['Category'],
-            x=filtered_df['Towns_Without'],
+            y=categories,
+            x=towns_without,
             orientation='h',
             marker=dict(
                 color='#e74c3c', 
                 opacity=0.6,
                 line=dict(color='#c0392b', width=2)
             ),
-            text=filtered_df['Towns_Without'],
+            text=towns_without,
             textposition='inside',
             hovertemplate='<b>%{y}</b><br>Towns without infrastructure: %{x}<extra></extra>',
             textfont_size=12
@@ -302,8 +406,14 @@ def create_infrastructure_availability_chart(df, selected_categories, chart_styl
                 font=dict(size=20, color='#fafafa'),
                 x=0.5
             ),
-            xaxis_title='Number of Towns',
-            yaxis_title='Infrastructure Type',
+            # Subtle grid on the value axis only
+            xaxis=dict(
+                title=dict(text='Number of Towns'),
+                showgrid=True,
+                gridwidth=1,
+                gridcolor='rgba(255,255,255,0.2)'
+            ),
+            yaxis=dict(title=dict(text='Infrastructure Type'), showgrid=False),
             barmode='stack',
             height=500,
             font=dict(size=12, color='#fafafa'),
@@ -317,25 +427,22 @@ def create_infrastructure_availability_chart(df, selected_categories, chart_styl
             plot_bgcolor='rgba(26,32,44,1)'
         )
         
-        # Add subtle grid animations
-        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(255,255,255,0.2)')
-        fig.update_yaxes(showgrid=False)
-        
     else:  # Donut Chart with subtle rotation animation
-        labels = []
-        values = []
-        colors = []
-        
         color_map = {
             'Hotels': '#3498db', 'Restaurants': '#e67e22', 'Cafes': '#9b59b6', 
             'Guest Houses': '#1abc9c', 'Tourist Attractions': '#f39c12'
         }
         
-        for _, row in filtered_df.iterrows():
-            labels.extend([f"{row['Category']} (Available)", f"{row['Category']} (Not Available)"])
-            values.extend([row['Towns_With'], row['Towns_Without']])
-            base_color = color_map.get(row['Category'], '#95a5a6')
-            colors.extend([base_color, base_color + '40'])
+        # Each category contributes an available / not available slice pair
+        categories = filtered_df['Category'].tolist()
+        labels = [f"{category} ({status})" for category in categories for status in ('Available', 'Not Available')]
+        values = np.column_stack([filtered_df['Towns_With'].to_numpy(), filtered_df['Towns_Without'].to_numpy()]).ravel()
+        base_colors = np.array([color_map.get(category, '#95a5a6') for category in categories], dtype=str)
+        colors = np.column_stack([base_colors, np.char.add(base_colors, '40')]).ravel()
+        
+        # Pull out the "Available" slice of every pair
+        pull = np.zeros(len(values))
+        pull[0::2] = 0.05
         
         fig = go.Figure(data=[go.Pie(
             labels=labels,
@@ -348,7 +455,7 @@ def create_infrastructure_availability_chart(df, selected_categories, chart_styl
             textinfo='label+percent',
             hovertemplate='<b>%{label}</b><br>Towns: %{value}<br>Percentage: %{percent}<extra></extra>',
             # Add subtle pull effect on hover
-            pull=[0.05 if 'Available' in label and not 'Not' in label else 0 for label in labels],
+            pull=pull,
             textfont_size=11
         )])
         
@@ -374,44 +481,56 @@ def create_infrastructure_availability_chart(df, selected_categories, chart_styl
     
     return fig
 
+@st.cache_data(show_spinner=False)
+def fit_trend_line(x, y):
+    """Return the correlation coefficient, slope and intercept of a linear fit of y on x"""
+    # Closed-form degree-1 least squares from centred sums of products
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x_mean, y_mean = x.mean(), y.mean()
+    dx, dy = x - x_mean, y - y_mean
+    sxx, syy, sxy = dx @ dx, dy @ dy, dx @ dy
+    
+    slope = sxy / sxx if sxx > 0 else 0.0
+    intercept = y_mean - slope * x_mean
+    correlation = sxy / np.sqrt(sxx * syy) if sxx > 0 and syy > 0 else np.nan
+    return correlation, slope, intercept
+
+@st.cache_data(show_spinner=False)
 def create_facility_correlation_chart(df, min_facilities, facility_types, show_correlation):
     """Create Visualization 2: Facility Count Correlation with hover animations"""
     
     # Filter data based on minimum facilities
-    filtered_df = df[df['Total_Facilities'] >= min_facilities].copy()
+    filtered_df = df[df['Total_Facilities'] >= min_facilities]
     
-    # Filter by selected facility types for size calculation
-    size_column = 0
-    if 'Hotels' in facility_types:
-        size_column += filtered_df['Total_Hotels']
-    if 'Restaurants' in facility_types:
-        size_column += filtered_df['Total_Restaurants']
-    if 'Cafes' in facility_types:
-        size_column += filtered_df['Total_Cafes']
-    if 'Guest Houses' in facility_types:
-        size_column += filtered_df['Total_Guest_Houses']
+    # Sum the selected facility types in one pass for the marker size;
+    # assign returns a new frame, so the filtered slice never needs a defensive copy
+    selected_columns = [FACILITY_TYPE_COLUMNS[facility_type] for facility_type in facility_types]
+    filtered_df = filtered_df.assign(Selected_Facilities=filtered_df[selected_columns].sum(axis=1))
     
-    filtered_df['Selected_Facilities'] = size_column
+    # Hand plotly plain arrays rather than pandas Series
+    hotels = filtered_df['Total_Hotels'].to_numpy()
+    restaurants = filtered_df['Total_Restaurants'].to_numpy()
     
     # Create scatter plot with subtle animations
     fig = go.Figure()
     
-    # Add scatter points with hover animations
-    fig.add_trace(go.Scatter(
-        x=filtered_df['Total_Hotels'],
-        y=filtered_df['Total_Restaurants'],
+    # Add scatter points with hover animations (WebGL renderer scales to many towns)
+    fig.add_trace(go.Scattergl(
+        x=hotels,
+        y=restaurants,
         mode='markers',
         marker=dict(
-            size=filtered_df['Selected_Facilities'] * 3 + 8,
-            color=filtered_df['Total_Facilities'],
+            size=filtered_df['Selected_Facilities'].to_numpy() * 3 + 8,
+            color=filtered_df['Total_Facilities'].to_numpy(),
             colorscale='Viridis',
             colorbar=dict(title="Total Facilities"),
             opacity=0.7,
-            line=dict(width=2, color='white'),
+            line=dict(width=1, color='white'),
             # Subtle size increase on hover
             sizemode='diameter'
         ),
-        text=filtered_df['Town'],
+        text=filtered_df['Town'].to_numpy(dtype=object),
         hovertemplate='<b>%{text}</b><br>' +
                      'Hotels: %{x}<br>' +
                      'Restaurants: %{y}<br>' +
@@ -422,18 +541,16 @@ def create_facility_correlation_chart(df, min_facilities, facility_types, show_c
         hoverlabel=dict(bgcolor="white", font_size=12, font_family="Arial")
     ))
     
-    # Add trend line with animation if requested
+    # Add trend line with animation if requested; the coefficient is returned for the insights
+    correlation = None
     if show_correlation and len(filtered_df) > 1:
-        correlation = np.corrcoef(filtered_df['Total_Hotels'], filtered_df['Total_Restaurants'])[0,1]
-        
         # Calculate trend line
-        z = np.polyfit(filtered_df['Total_Hotels'], filtered_df['Total_Restaurants'], 1)
-        p = np.poly1d(z)
+        correlation, slope, intercept = fit_trend_line(hotels, restaurants)
         
-        x_trend = np.linspace(filtered_df['Total_Hotels'].min(), filtered_df['Total_Hotels'].max(), 50)
-        y_trend = p(x_trend)
+        x_trend = np.linspace(hotels.min(), hotels.max(), 50)
+        y_trend = slope * x_trend + intercept
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=x_trend,
             y=y_trend,
             mode='lines',
@@ -462,8 +579,23 @@ def create_facility_correlation_chart(df, min_facilities, facility_types, show_c
             font=dict(size=20, color='#fafafa'),
             x=0.5
         ),
-        xaxis_title='Number of Hotels',
-        yaxis_title='Number of Restaurants',
+        # Axes carry the subtle grid styling, set in the same layout pass
+        xaxis=dict(
+            title=dict(text='Number of Hotels', font=dict(color='#fafafa')),
+            showgrid=True,
+            gridwidth=1,
+            gridcolor='rgba(255,255,255,0.2)',
+            zeroline=True,
+            zerolinecolor='rgba(255,255,255,0.4)'
+        ),
+        yaxis=dict(
+            title=dict(text='Number of Restaurants', font=dict(color='#fafafa')),
+            showgrid=True,
+            gridwidth=1,
+            gridcolor='rgba(255,255,255,0.2)',
+            zeroline=True,
+            zerolinecolor='rgba(255,255,255,0.4)'
+        ),
         height=600,
         template='plotly_dark',
         showlegend=True,
@@ -476,57 +608,84 @@ def create_facility_correlation_chart(df, min_facilities, facility_types, show_c
         plot_bgcolor='rgba(26,32,44,1)'
     )
     
-    # Add subtle grid with animations
-    fig.update_xaxes(
-        showgrid=True, 
-        gridwidth=1, 
-        gridcolor='rgba(255,255,255,0.2)',
-        zeroline=True,
-        zerolinecolor='rgba(255,255,255,0.4)',
-        title_font=dict(color='#fafafa')
-    )
-    fig.update_yaxes(
-        showgrid=True, 
-        gridwidth=1, 
-        gridcolor='rgba(255,255,255,0.2)',
-        zeroline=True,
-        zerolinecolor='rgba(255,255,255,0.4)',
-        title_font=dict(color='#fafafa')
-    )
+    return fig, filtered_df, correlation
+
+@st.cache_data(show_spinner=False)
+def compute_readiness_summary(correlation_df, total_towns):
+    """Count towns with both hotels and restaurants and towns with 10+ facilities, with formatted share deltas"""
+    hotels = correlation_df['Total_Hotels'].to_numpy()
+    restaurants = correlation_df['Total_Restaurants'].to_numpy()
+    facilities = correlation_df['Total_Facilities'].to_numpy()
+    
+    towns_with_both = int(np.count_nonzero((hotels > 0) & (restaurants > 0)))
+    comprehensive_hubs = int(np.count_nonzero(facilities >= 10))
+    
+    hubs_delta = f"{comprehensive_hubs/total_towns*100:.1f}% of all towns"
+    both_delta = f"{towns_with_both/total_towns*100:.1f}% have both hotels & restaurants"
+    return towns_with_both, comprehensive_hubs, both_delta, hubs_delta
+
+@st.cache_data(show_spinner=False)
+def get_top_destinations(correlation_df, k=5):
+    """Return the k towns with the most facilities, formatted for the summary table"""
+    # Partial selection of the k largest totals; ties keep their original order as nlargest does
+    facilities = correlation_df['Total_Facilities'].to_numpy()
+    k = min(k, facilities.size)
+    kth_largest = np.partition(facilities, facilities.size - k)[facilities.size - k]
+    candidates = np.flatnonzero(facilities >= kth_largest)
+    top_idx = candidates[np.argsort(-facilities[candidates], kind='stable')][:k]
+    # Gather only the displayed columns for the winning rows; counts are already
+    # rounded integers from process_facility_counts, so no cast is needed
+    columns = ['Town', 'Total_Hotels', 'Total_Restaurants', 'Total_Cafes', 'Total_Guest_Houses', 'Total_Facilities']
+    return pd.DataFrame({col: correlation_df[col].to_numpy()[top_idx] for col in columns})
+
+def render_infrastructure_assessment(correlation_df, total_towns):
+    """Render the comprehensive assessment summary, top destinations and recommendations"""
+    st.markdown('<div class="sub-header">🎯 Comprehensive Tourism Infrastructure Assessment</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(READINESS_SUMMARY_HTML, unsafe_allow_html=True)
+        
+        # Calculate comprehensive metrics only when there are towns to count
+        if total_towns and not correlation_df.empty:
+            towns_with_both, comprehensive_hubs, both_delta, hubs_delta = compute_readiness_summary(correlation_df, total_towns)
+            st.metric("Tourism-Ready Towns", f"{comprehensive_hubs}", hubs_delta)
+            st.metric("Integrated Infrastructure", f"{towns_with_both}", both_delta)
+        else:
+            st.metric("Tourism-Ready Towns", "0")
+            st.metric("Integrated Infrastructure", "0")
+    
+    with col2:
+        # Top 5 most comprehensive tourism destinations
+        if not correlation_df.empty:
+            top_destinations = get_top_destinations(correlation_df)
+            
+            st.markdown("### 🌟 Top Tourism Destinations")
+            st.dataframe(
+                top_destinations,
+                use_container_width=True,
+                hide_index=True
+            )
     
-    return fig, filtered_df
+    # Final Recommendations
+    st.markdown(RECOMMENDATIONS_HTML, unsafe_allow_html=True)
 
 def main():
     # Header
-    st.markdown('<div class="main-header">🇱🇧 Lebanon Tourism Infrastructure Analysis</div>', unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # Introduction and Context
-    st.markdown("""
-    <div class="context-section">
-    <h2>📖 Analysis Overview</h2>
-    <p style="font-size: 1.1rem; line-height: 1.6;">
-    This comprehensive analysis explores Lebanon's tourism infrastructure through two complementary visualizations 
-    that reveal critical insights about the country's tourism readiness and development patterns.
-    </p>
-    
-    <h3>🎯 Research Questions:</h3>
-    <ul style="font-size: 1rem; line-height: 1.5;">
-    <li><strong>Infrastructure Distribution:</strong> How evenly distributed are tourism facilities across Lebanese towns?</li>
-    <li><strong>Facility Correlation:</strong> Do towns with more hotels also have more restaurants, indicating integrated tourism development?</li>
-    <li><strong>Tourism Readiness:</strong> Which towns are best equipped to handle tourists with comprehensive infrastructure?</li>
-    </ul>
-    
-    <h3>📊 Data Source:</h3>
-    <p style="font-size: 1rem;">
-    American University of Beirut (AUB) Lebanon Tourism Infrastructure Dataset - A comprehensive survey of 
-    tourism facilities and attractions across Lebanese municipalities.
-    </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(OVERVIEW_HTML, unsafe_allow_html=True)
     
     # Load data
     with st.spinner("🔄 Loading Lebanon tourism data..."):
-        raw_data = load_data()
+        # Errors are raised out of the cached loader so a failed download is never persisted
+        try:
+            raw_data = load_data()
+        except Exception as e:
+            st.error(f"Error loading data: {e}")
+            raw_data = None
     
     if raw_data is None:
         st.error("❌ Failed to load data. Please check your internet connection.")
@@ -535,6 +694,11 @@ def main():
     # Process data
     infrastructure_df = process_infrastructure_data(raw_data)
     facility_counts_df = process_facility_counts(raw_data)
+    total_towns = len(raw_data)
+    
+    # Facility statistics shared by the threshold slider and the metric cards
+    avg_facilities = facility_counts_df['Total_Facilities'].mean()
+    max_facilities = facility_counts_df['Total_Facilities'].max()
     
     # Sidebar controls
     st.sidebar.markdown("## 🎛️ Interactive Dashboard Controls")
@@ -542,7 +706,7 @@ def main():
     
     # Dataset overview
     st.sidebar.markdown("### 📊 Dataset Overview")
-    st.sidebar.metric("Total Towns Analyzed", len(raw_data))
+    st.sidebar.metric("Total Towns Analyzed", total_towns)
     st.sidebar.metric("Towns with Facilities", len(facility_counts_df))
     st.sidebar.metric("Infrastructure Categories", len(infrastructure_df))
     
@@ -573,14 +737,14 @@ def main():
     min_facilities = st.sidebar.slider(
         "Minimum Total Facilities:",
         min_value=0,
-        max_value=int(facility_counts_df['Total_Facilities'].max()),
+        max_value=int(max_facilities),
         value=1,
         help="Filter towns with at least this many total facilities"
     )
     
     facility_types = st.sidebar.multiselect(
         "Facility Types for Size Scaling:",
-        options=['Hotels', 'Restaurants', 'Cafes', 'Guest Houses'],
+        options=list(FACILITY_TYPE_COLUMNS),
         default=['Hotels', 'Restaurants'],
         help="Select which facilities determine bubble size"
     )
@@ -600,223 +764,133 @@ def main():
         st.warning("⚠️ Please select at least one facility type for correlation analysis.")
         return
     
-    # Key Metrics Dashboard
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        total_towns_with_hotels = infrastructure_df[infrastructure_df['Category'] == 'Hotels']['Towns_With'].iloc[0]
-        hotel_percentage = infrastructure_df[infrastructure_df['Category'] == 'Hotels']['Availability_Percentage'].iloc[0]
-        st.markdown('<div class="metric-container">', unsafe_allow_html=True)
-        st.metric("Towns with Hotels", f"{total_towns_with_hotels}", f"{hotel_percentage:.1f}%")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col2:
-        total_towns_with_restaurants = infrastructure_df[infrastructure_df['Category'] == 'Restaurants']['Towns_With'].iloc[0]
-        restaurant_percentage = infrastructure_df[infrastructure_df['Category'] == 'Restaurants']['Availability_Percentage'].iloc[0]
-        st.markdown('<div class="metric-container">', unsafe_allow_html=True)
-        st.metric("Towns with Restaurants", f"{total_towns_with_restaurants}", f"{restaurant_percentage:.1f}%")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col3:
-        total_towns_with_attractions = infrastructure_df[infrastructure_df['Category'] == 'Tourist Attractions']['Towns_With'].iloc[0]
-        attraction_percentage = infrastructure_df[infrastructure_df['Category'] == 'Tourist Attractions']['Availability_Percentage'].iloc[0]
-        st.markdown('<div class="metric-container">', unsafe_allow_html=True)
-        st.metric("Towns with Attractions", f"{total_towns_with_attractions}", f"{attraction_percentage:.1f}%")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col4:
-        avg_facilities = facility_counts_df['Total_Facilities'].mean()
-        max_facilities = facility_counts_df['Total_Facilities'].max()
-        st.markdown('<div class="metric-container">', unsafe_allow_html=True)
-        st.metric("Avg Facilities/Town", f"{avg_facilities:.1f}", f"Max: {max_facilities:.0f}")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # VISUALIZATION 1: Infrastructure Availability
-    st.markdown('<div class="sub-header">📊 Visualization 1: Tourism Infrastructure Availability Analysis</div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    <div class="insight-box">
-    <h4>🔍 What This Shows:</h4>
-    This visualization reveals how tourism infrastructure is distributed across Lebanese towns, 
-    showing which types of facilities are most commonly available and identifying gaps in tourism readiness.
-    </div>
-    """, unsafe_allow_html=True)
-    
-    with st.container():
-        st.markdown('<div class="visualization-container">', unsafe_allow_html=True)
-        
-        viz1_fig = create_infrastructure_availability_chart(infrastructure_df, selected_categories, chart_style)
-        st.plotly_chart(viz1_fig, use_container_width=True, config={
-            'displayModeBar': True,
-            'toImageButtonOptions': {
-                'format': 'png',
-                'filename': 'lebanon_infrastructure_availability',
-                'height': 800,
-                'width': 1200,
-                'scale': 2
-            }
-        })
-        
-        # Download buttons for Visualization 1
-        st.markdown('<div class="download-section">', unsafe_allow_html=True)
-        st.markdown("**📥 Download Options:**")
-        create_download_buttons(viz1_fig, "lebanon_infrastructure_availability")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Insights for Visualization 1
+    # Restrict infrastructure data to the selected categories once for chart and insights
     filtered_infra_df = infrastructure_df[infrastructure_df['Category'].isin(selected_categories)]
-    best_infrastructure = filtered_infra_df.loc[filtered_infra_df['Availability_Percentage'].idxmax()]
-    worst_infrastructure = filtered_infra_df.loc[filtered_infra_df['Availability_Percentage'].idxmin()]
-    
-    st.markdown(f"""
-    <div class="insight-box">
-    <h4>💡 Key Insights from Infrastructure Analysis:</h4>
-    <ul>
-    <li><strong>Best Available:</strong> {best_infrastructure['Category']} are available in {best_infrastructure['Availability_Percentage']:.1f}% of towns ({best_infrastructure['Towns_With']} towns)</li>
-    <li><strong>Biggest Gap:</strong> {worst_infrastructure['Category']} are only available in {worst_infrastructure['Availability_Percentage']:.1f}% of towns ({worst_infrastructure['Towns_With']} towns)</li>
-    <li><strong>Development Opportunity:</strong> {'High restaurant availability suggests strong local dining culture' if best_infrastructure['Category'] == 'Restaurants' else 'Infrastructure development needed for tourism growth'}</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # VISUALIZATION 2: Facility Correlation
-    st.markdown('<div class="sub-header">🔗 Visualization 2: Hotel-Restaurant Correlation & Tourism Integration</div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    <div class="insight-box">
-    <h4>🔍 What This Shows:</h4>
-    This scatter plot analysis reveals the relationship between hotel and restaurant availability across towns, 
-    indicating whether tourism infrastructure develops in an integrated manner. Bubble sizes represent total facilities, 
-    helping identify comprehensive tourism hubs.
-    </div>
-    """, unsafe_allow_html=True)
-    
-    with st.container():
-        st.markdown('<div class="visualization-container">', unsafe_allow_html=True)
-        
-        viz2_fig, correlation_df = create_facility_correlation_chart(facility_counts_df, min_facilities, facility_types, show_correlation)
-        st.plotly_chart(viz2_fig, use_container_width=True, config={
-            'displayModeBar': True,
-            'toImageButtonOptions': {
-                'format': 'png',
-                'filename': 'lebanon_hotel_restaurant_correlation',
-                'height': 800,
-                'width': 1200,
-                'scale': 2
-            }
-        })
-        
-        # Download buttons for Visualization 2
-        st.markdown('<div class="download-section">', unsafe_allow_html=True)
-        st.markdown("**📥 Download Options:**")
-        create_download_buttons(viz2_fig, "lebanon_hotel_restaurant_correlation")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Insights for Visualization 2
-    if len(correlation_df) > 1 and show_correlation:
-        correlation_coeff = np.corrcoef(correlation_df['Total_Hotels'], correlation_df['Total_Restaurants'])[0,1]
-        
-        # Find top tourism hubs
-        top_hubs = correlation_df.nlargest(3, 'Total_Facilities')[['Town', 'Total_Hotels', 'Total_Restaurants', 'Total_Facilities']]
-        
-        correlation_interpretation = ""
-        if correlation_coeff > 0.7:
-            correlation_interpretation = "Strong positive correlation - towns with more hotels consistently have more restaurants, indicating integrated tourism development."
-        elif correlation_coeff > 0.3:
-            correlation_interpretation = "Moderate positive correlation - some tendency for hotels and restaurants to develop together."
-        elif correlation_coeff > -0.3:
-            correlation_interpretation = "Weak correlation - hotels and restaurants develop somewhat independently across towns."
-        else:
-            correlation_interpretation = "Negative correlation - unusual pattern suggesting specialized tourism functions."
-        
-        st.markdown(f"""
-        <div class="insight-box">
-        <h4>🔗 Correlation Analysis Insights:</h4>
-        <ul>
-        <li><strong>Correlation Strength:</strong> {correlation_coeff:.3f} - {correlation_interpretation}</li>
-        <li><strong>Towns Analyzed:</strong> {len(correlation_df)} towns with {min_facilities}+ facilities</li>
-        <li><strong>Top Tourism Hub:</strong> {top_hubs.iloc[0]['Town']} ({int(top_hubs.iloc[0]['Total_Hotels'])} hotels, {int(top_hubs.iloc[0]['Total_Restaurants'])} restaurants)</li>
-        <li><strong>Tourism Integration:</strong> {'High' if correlation_coeff > 0.5 else 'Moderate' if correlation_coeff > 0.3 else 'Low'} level of integrated tourism infrastructure development</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Comprehensive Analysis Summary
-    st.markdown('<div class="sub-header">🎯 Comprehensive Tourism Infrastructure Assessment</div>', unsafe_allow_html=True)
-    
-    # Calculate comprehensive metrics
-    total_towns = len(raw_data)
-    towns_with_both = len(correlation_df[(correlation_df['Total_Hotels'] > 0) & (correlation_df['Total_Restaurants'] > 0)])
-    comprehensive_hubs = len(correlation_df[correlation_df['Total_Facilities'] >= 10])
-    
-    col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown("""
-        <div class="insight-box">
-        <h4>🏆 Tourism Readiness Summary</h4>
-        <ul>
-        <li><strong>Comprehensive Tourism Hubs:</strong> Towns with 10+ total facilities</li>
-        <li><strong>Integrated Development:</strong> Towns with both hotels and restaurants</li>
-        <li><strong>Infrastructure Gaps:</strong> Areas needing development focus</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.metric("Tourism-Ready Towns", f"{comprehensive_hubs}", f"{comprehensive_hubs/total_towns*100:.1f}% of all towns")
-        st.metric("Integrated Infrastructure", f"{towns_with_both}", f"{towns_with_both/total_towns*100:.1f}% have both hotels & restaurants")
+    # Key Metrics Dashboard
+    infra_lookup = infrastructure_df.set_index('Category').to_dict('index')
+    metric_cards = [
+        (f"Towns with {label}", f"{infra_lookup[category]['Towns_With']}", f"{infra_lookup[category]['Availability_Percentage']:.1f}%")
+        for label, category in (('Hotels', 'Hotels'), ('Restaurants', 'Restaurants'), ('Attractions', 'Tourist Attractions'))
+    ]
+    metric_cards.append(("Avg Facilities/Town", f"{avg_facilities:.1f}", f"Max: {max_facilities:.0f}"))
+    
+    for col, (label, value, delta) in zip(st.columns(4), metric_cards):
+        with col:
+            st.markdown('<div class="metric-container">', unsafe_allow_html=True)
+            st.metric(label, value, delta)
+            st.markdown('</div>', unsafe_allow_html=True)
+    
+    # The correlation frame also feeds the assessment below, so it is built outside the tabs
+    viz2_fig, correlation_df, correlation_coeff = create_facility_correlation_chart(facility_counts_df, min_facilities, tuple(facility_types), show_correlation)
+    
+    # Only the selected tab's charts, downloads and insights are rendered on each rerun
+    viz1_tab, viz2_tab = st.tabs(
+        ["📊 Infrastructure Availability", "🔗 Hotel-Restaurant Correlation"],
+        on_change="rerun"
+    )
     
-    with col2:
-        # Top 5 most comprehensive tourism destinations
-        if not correlation_df.empty:
-            top_destinations = correlation_df.nlargest(5, 'Total_Facilities')[['Town', 'Total_Hotels', 'Total_Restaurants', 'Total_Cafes', 'Total_Guest_Houses', 'Total_Facilities']].copy()
+    with viz1_tab:
+        if viz1_tab.open:
+            # VISUALIZATION 1: Infrastructure Availability
+            st.markdown('<div class="sub-header">📊 Visualization 1: Tourism Infrastructure Availability Analysis</div>', unsafe_allow_html=True)
             
-            # Only convert numeric columns to integers
-            numeric_columns = ['Total_Hotels', 'Total_Restaurants', 'Total_Cafes', 'Total_Guest_Houses', 'Total_Facilities']
-            for col in numeric_columns:
-                if col in top_destinations.columns:
-                    top_destinations[col] = top_destinations[col].round(0).astype(int)
+            st.markdown("""
+            <div class="insight-box">
+            <h4>🔍 What This Shows:</h4>
+            This visualization reveals how tourism infrastructure is distributed across Lebanese towns, 
+            showing which types of facilities are most commonly available and identifying gaps in tourism readiness.
+            </div>
+            """, unsafe_allow_html=True)
             
-            st.markdown("### 🌟 Top Tourism Destinations")
-            st.dataframe(
-                top_destinations,
-                use_container_width=True,
-                hide_index=True
-            )
-    
-    # Final Recommendations
-    st.markdown("""
-    <div class="context-section">
-    <h3>📋 Strategic Recommendations</h3>
-    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 2rem;">
-        <div>
-            <h4>🎯 For Tourism Development:</h4>
-            <ul>
-            <li>Focus on towns with attractions but limited infrastructure</li>
-            <li>Develop integrated hotel-restaurant complexes</li>
-            <li>Support infrastructure in high-potential areas</li>
-            </ul>
-        </div>
-        <div>
-            <h4>📊 For Further Analysis:</h4>
+            with st.container():
+                st.markdown('<div class="visualization-container">', unsafe_allow_html=True)
+                
+                viz1_fig = create_infrastructure_availability_chart(filtered_infra_df, chart_style)
+                st.plotly_chart(viz1_fig, use_container_width=True, theme=None, config=PLOTLY_CHART_CONFIG)
+                
+                # Download buttons for Visualization 1
+                st.markdown('<div class="download-section">', unsafe_allow_html=True)
+                st.markdown("**📥 Download Options:**")
+                create_download_buttons(viz1_fig, "lebanon_infrastructure_availability")
+                st.markdown('</div>', unsafe_allow_html=True)
+                
+                st.markdown('</div>', unsafe_allow_html=True)
+            
+            # Insights for Visualization 1
+            best_infrastructure = filtered_infra_df.loc[filtered_infra_df['Availability_Percentage'].idxmax()]
+            worst_infrastructure = filtered_infra_df.loc[filtered_infra_df['Availability_Percentage'].idxmin()]
+            
+            st.markdown(f"""
+            <div class="insight-box">
+            <h4>💡 Key Insights from Infrastructure Analysis:</h4>
             <ul>
-            <li>Geographic clustering analysis of facilities</li>
-            <li>Seasonal capacity vs. demand analysis</li>
-            <li>Infrastructure quality assessment</li>
+            <li><strong>Best Available:</strong> {best_infrastructure['Category']} are available in {best_infrastructure['Availability_Percentage']:.1f}% of towns ({best_infrastructure['Towns_With']} towns)</li>
+            <li><strong>Biggest Gap:</strong> {worst_infrastructure['Category']} are only available in {worst_infrastructure['Availability_Percentage']:.1f}% of towns ({worst_infrastructure['Towns_With']} towns)</li>
+            <li><strong>Development Opportunity:</strong> {'High restaurant availability suggests strong local dining culture' if best_infrastructure['Category'] == 'Restaurants' else 'Infrastructure development needed for tourism growth'}</li>
             </ul>
-        </div>
-    </div>
-    </div>
-    """, unsafe_allow_html=True)
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with viz2_tab:
+        if viz2_tab.open:
+            # VISUALIZATION 2: Facility Correlation
+            st.markdown('<div class="sub-header">🔗 Visualization 2: Hotel-Restaurant Correlation & Tourism Integration</div>', unsafe_allow_html=True)
+            
+            st.markdown("""
+            <div class="insight-box">
+            <h4>🔍 What This Shows:</h4>
+            This scatter plot analysis reveals the relationship between hotel and restaurant availability across towns, 
+            indicating whether tourism infrastructure develops in an integrated manner. Bubble sizes represent total facilities, 
+            helping identify comprehensive tourism hubs.
+            </div>
+            """, unsafe_allow_html=True)
+            
+            with st.container():
+                st.markdown('<div class="visualization-container">', unsafe_allow_html=True)
+                
+                st.plotly_chart(viz2_fig, use_container_width=True, theme=None, config=PLOTLY_CHART_CONFIG)
+                
+                # Download buttons for Visualization 2
+                st.markdown('<div class="download-section">', unsafe_allow_html=True)
+                st.markdown("**📥 Download Options:**")
+                create_download_buttons(viz2_fig, "lebanon_hotel_restaurant_correlation")
+                st.markdown('</div>', unsafe_allow_html=True)
+                
+                st.markdown('</div>', unsafe_allow_html=True)
+            
+            # Insights for Visualization 2
+            if correlation_coeff is not None:
+                # Find top tourism hubs
+                top_hubs = correlation_df.nlargest(3, 'Total_Facilities')[['Town', 'Total_Hotels', 'Total_Restaurants', 'Total_Facilities']]
+                
+                correlation_interpretation = ""
+                if correlation_coeff > 0.7:
+                    correlation_interpretation = "Strong positive correlation - towns with more hotels consistently have more restaurants, indicating integrated tourism development."
+                elif correlation_coeff > 0.3:
+                    correlation_interpretation = "Moderate positive correlation - some tendency for hotels and restaurants to develop together."
+                elif correlation_coeff > -0.3:
+                    correlation_interpretation = "Weak correlation - hotels and restaurants develop somewhat independently across towns."
+                else:
+                    correlation_interpretation = "Negative correlation - unusual pattern suggesting specialized tourism functions."
+                
+                st.markdown(f"""
+                <div class="insight-box">
+                <h4>🔗 Correlation Analysis Insights:</h4>
+                <ul>
+                <li><strong>Correlation Strength:</strong> {correlation_coeff:.3f} - {correlation_interpretation}</li>
+                <li><strong>Towns Analyzed:</strong> {len(correlation_df)} towns with {min_facilities}+ facilities</li>
+                <li><strong>Top Tourism Hub:</strong> {top_hubs.iloc[0]['Town']} ({int(top_hubs.iloc[0]['Total_Hotels'])} hotels, {int(top_hubs.iloc[0]['Total_Restaurants'])} restaurants)</li>
+                <li><strong>Tourism Integration:</strong> {'High' if correlation_coeff > 0.5 else 'Moderate' if correlation_coeff > 0.3 else 'Low'} level of integrated tourism infrastructure development</li>
+                </ul>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    # Comprehensive Analysis Summary
+    render_infrastructure_assessment(correlation_df, total_towns)
     
     # Footer
-    st.markdown("---")
-    st.markdown("**📊 Data Source:** American University of Beirut - Lebanon Tourism Infrastructure Study")
-    st.markdown("**✨ Enhanced Features:** Interactive filtering, dynamic visualizations, correlation analysis, and download capabilities")
+    st.markdown(FOOTER_MARKDOWN)
 
 if __name__ == "__main__":
     main()